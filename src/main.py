@@ -1,9 +1,32 @@
 import re
+
+try:
+    import re2  # google-re2 bindings: DFA engine, linear-time scanning
+except ImportError:
+    re2 = None
+
+try:
+    import regex  # third-party engine with lower per-match overhead
+except ImportError:
+    regex = None
+
+try:
+    import xxhash  # fast non-cryptographic hashing for token fingerprints
+except ImportError:
+    xxhash = None
+
+import hashlib
+import time
+
+import numpy as np
+
+from native_lexer import NATIVE_KIND_NAMES, lex_bytes as native_lex_bytes
+from numba_lexer import lex_arrays as numba_lex_arrays, lex_string as numba_lex_string
+
 import streamlit as st
 import plotly.express as px
 import pandas as pd
 from streamlit_option_menu import option_menu
-from anytree import Node, RenderTree
 
 # Set page config at the top
 st.set_page_config(page_title="C Lexer Analyzer", layout="wide", page_icon="🧠")
@@ -11,10 +34,13 @@ st.set_page_config(page_title="C Lexer Analyzer", layout="wide", page_icon="🧠
 # ---------------------------
 # Session State for Persistence
 # ---------------------------
-if 'tokens' not in st.session_state:
-    st.session_state.tokens = []
+if 'tokens_df' not in st.session_state:
+    st.session_state.tokens_df = pd.DataFrame(columns=["Line", "Type", "Value"])
     st.session_state.errors = []
     st.session_state.code = ''
+    st.session_state.live_last_code = ''
+    st.session_state.live_last_ts = 0.0
+    st.session_state.live_settle = False
 
 # ---------------------------
 # Regex Definitions
@@ -22,81 +48,309 @@ if 'tokens' not in st.session_state:
 token_specs = [
     ('Library',              r'#include[ \t]*<[^>]+>'),
     ('Line_Comment',         r'//[^\n]*'),
-    ('Block_Comment',        r'/\*.*?\*/'),
-    ('Access_Specifier',     r'\b(private|protected|public)\b'),
-    ('Data_Type',            r'\b(int|float|double|char|bool|string|long|short|void)\b'),
-    ('Keyword',              r'\b(if|else|while|for|return|break|continue|switch|case|default|sizeof|do|goto|enum|typedef|struct|class|const|static|volatile|signed|unsigned|try|catch|throw|new|delete)\b'),
+    ('Block_Comment',        r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/'),
     ('Bracket_Parenthesis',  r'[{}\[\]()]'),
     ('Delimiter',            r'[;,:]'),
-    ('Assignment_Operator',  r'='),
-    ('Increment_Decrement_Operator', r'\+\+|--'),
-    ('Arithmetic_Operator',  r'[+\-*/%]'),
-    ('Relational_Operator',  r'(==|!=|<=|>=|<|>)'),
-    ('Logical_Operator',     r'(\|\||&&|!)'),
-    ('Bitwise_Operator',     r'(&|\||\^|~|<<|>>)'),
-    ('Float_Constant',       r'\b\d+\.\d+\b'),
-    ('Integer_Constant',     r'\b\d+\b'),
-    ('Character_Constant',   r"'([^\\']|\\.)'"),
-    ('String_Literal',       r'"([^\\"]|\\.)*"'),
-    ('Identifier',           r'\b[A-Za-z_][A-Za-z_0-9]*\b'),
-    ('Whitespace',           r'[ \t\r]+'),
-    ('Newline',              r'\n'),
-    ('Unknown_Token',        r'.'),
+    ('Operator',             r'\+\+|--|==|!=|<=|>=|<<|>>|&&|\|\||[=+\-*/%<>!&|^~]'),
+    # Unanchored, like the DFA scanners: '123abc' lexes as an integer
+    # followed by an identifier rather than failing on the missing \b.
+    ('Float_Constant',       r'\d+\.\d+'),
+    ('Integer_Constant',     r'\d+'),
+    # \\[\s\S] (not \\.) so backslash escapes still consume a newline —
+    # a C line continuation inside a literal — without needing DOTALL.
+    ('Character_Constant',   r"'([^\\']|\\[\s\S])'"),
+    ('String_Literal',       r'"([^\\"]|\\[\s\S])*"'),
+    ('Identifier',           r'[A-Za-z_][A-Za-z_0-9]*'),
+    ('Skip',                 r'[ \t\r\n]+'),
 ]
 
-compiled_regex = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specs), re.DOTALL)
+# Keywords are classified after the match with one dict lookup (a C-level
+# hash table) instead of \b(...|...)\b alternations that the regex engine
+# would try linearly at every identifier. The master pattern only keeps a
+# generic Identifier rule, shrinking its NFA by ~40 alternatives.
+KW_TABLE = {}
+for _kw in ('private', 'protected', 'public'):
+    KW_TABLE[_kw] = 'Access_Specifier'
+for _kw in ('int', 'float', 'double', 'char', 'bool', 'string', 'long',
+            'short', 'void'):
+    KW_TABLE[_kw] = 'Data_Type'
+for _kw in ('if', 'else', 'while', 'for', 'return', 'break', 'continue',
+            'switch', 'case', 'default', 'sizeof', 'do', 'goto', 'enum',
+            'typedef', 'struct', 'class', 'const', 'static', 'volatile',
+            'signed', 'unsigned', 'try', 'catch', 'throw', 'new', 'delete'):
+    KW_TABLE[_kw] = 'Keyword'
+
+# Operators match through one rule whose two-character alternatives come
+# first, then classify by value — maximal munch with first-match
+# semantics, so '==' and '<<' lex identically to the native and numba
+# scanners regardless of which backend is installed.
+OPERATOR_KINDS = {'=': 'Assignment_Operator'}
+for _op in ('++', '--'):
+    OPERATOR_KINDS[_op] = 'Increment_Decrement_Operator'
+for _op in ('+', '-', '*', '/', '%'):
+    OPERATOR_KINDS[_op] = 'Arithmetic_Operator'
+for _op in ('==', '!=', '<=', '>=', '<', '>'):
+    OPERATOR_KINDS[_op] = 'Relational_Operator'
+for _op in ('||', '&&', '!'):
+    OPERATOR_KINDS[_op] = 'Logical_Operator'
+for _op in ('<<', '>>', '&', '|', '^', '~'):
+    OPERATOR_KINDS[_op] = 'Bitwise_Operator'
+
+_master_pattern = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specs)
+
+
+def _compile_master(pattern):
+    # Prefer re2's DFA engine (no alternation backtracking), then the
+    # third-party regex module, then the stock backtracking engine.
+    # No DOTALL: Block_Comment uses the Dragon-book [^*]/*+ form, so no
+    # rule needs '.' to cross newlines.
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    if regex is not None:
+        return regex.compile(pattern)
+    return re.compile(pattern)
+
+
+compiled_regex = _compile_master(_master_pattern)
+
+# Bytes-mode twin of the master pattern: matching bytes against a bytes
+# pattern keeps sre on its narrow Py_UCS1 code paths, which is measurably
+# faster for the common all-ASCII source file.
+compiled_regex_bytes = _compile_master(_master_pattern.encode('ascii'))
+
+# Integer group indices let the lex loop route matches with a set lookup
+# instead of comparing group-name strings.
+_SKIP_GROUPS = frozenset({compiled_regex.groupindex['Skip']})
+_IDENTIFIER_GROUP = compiled_regex.groupindex['Identifier']
+_OPERATOR_GROUP = compiled_regex.groupindex['Operator']
 
 # ---------------------------
 # Lexer Logic
 # ---------------------------
 
 
+def _lex_iter(source_code, errors):
+    """Yield (line, kind, value) tuples, appending lexical errors to ``errors``.
+
+    A generator so callers that only need a DataFrame can consume tokens
+    without an intermediate Python list.
+    """
+    # Native re2c scanner (direct-coded DFA): one indirect jump per token
+    # instead of a regex-VM dispatch. Only used when liblexer.so was built.
+    if native_lex_bytes is not None:
+        for line_no, kind, value in native_lex_bytes(source_code.encode('utf-8')):
+            if kind == 'Unknown_Token':
+                errors.append((line_no, 'Unknown Token', value))
+            else:
+                yield (line_no, kind, value)
+        return
+
+    # Numba JIT scanner: a hand-coded DFA over the uint8-encoded source,
+    # emitting (start, end, kind) into preallocated arrays. Only used
+    # when numba is installed.
+    if numba_lex_string is not None:
+        for line_no, kind, value in numba_lex_string(source_code):
+            if kind == 'Unknown_Token':
+                errors.append((line_no, 'Unknown Token', value))
+            else:
+                yield (line_no, kind, value)
+        return
+
+    # Line numbers are looked up lazily from a cumulative array of
+    # line-start offsets instead of counting Newline tokens one by one.
+    line_starts = np.array(
+        [0] + [i + 1 for i, c in enumerate(source_code) if c == '\n'],
+        dtype=np.int64)
+
+    # ASCII fast path: scan the encoded bytes with the bytes-compiled
+    # pattern (byte offsets equal character offsets for pure ASCII).
+    as_bytes = source_code.isascii()
+    if as_bytes:
+        matches = list(compiled_regex_bytes.finditer(source_code.encode('ascii')))
+    else:
+        matches = list(compiled_regex.finditer(source_code))
+
+    # Characters not covered by any match are lexical errors; tracking
+    # them with a boolean mask replaces the old catch-all '.' rule, which
+    # the regex engine had to consider at every position.
+    covered = np.zeros(len(source_code), dtype=bool)
+
+    if matches:
+        # Assign line numbers for all matches in one vectorized pass.
+        starts = np.fromiter((m.start() for m in matches),
+                             dtype=np.int64, count=len(matches))
+        lines = np.searchsorted(line_starts, starts, side='right').tolist()
+
+        for match, line_no in zip(matches, lines):
+            covered[match.start():match.end()] = True
+            if match.lastindex in _SKIP_GROUPS:
+                continue
+            value = match.group()
+            if as_bytes:
+                value = value.decode('ascii')
+            if match.lastindex == _IDENTIFIER_GROUP:
+                kind = KW_TABLE.get(value, 'Identifier')
+            elif match.lastindex == _OPERATOR_GROUP:
+                kind = OPERATOR_KINDS[value]
+            else:
+                kind = match.lastgroup
+                # re2 reports bytes group names for a bytes pattern.
+                if isinstance(kind, bytes):
+                    kind = kind.decode('ascii')
+            yield (line_no, kind, value)
+
+    for pos in np.nonzero(~covered)[0].tolist():
+        ch = source_code[pos]
+        # Only the Skip class is benign; \v, \f and Unicode spaces are
+        # lexical errors, as the native and numba scanners report them.
+        if ch in ' \t\r\n':
+            continue
+        line_no = int(np.searchsorted(line_starts, pos, side='right'))
+        errors.append((line_no, 'Unknown Token', ch))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
 def lex_code(source_code):
-    tokens = []
-    line_no = 1
     errors = []
-    for match in compiled_regex.finditer(source_code):
-        kind = match.lastgroup
-        value = match.group()
+    return list(_lex_iter(source_code, errors)), errors
+
+
+_UNKNOWN_KIND = NATIVE_KIND_NAMES.index('Unknown_Token')
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def lex_code_df(source_code):
+    # Struct-of-arrays fast path: the JIT scanner already produces
+    # parallel (lines, kinds, values) arrays, so the DataFrame is built
+    # column-wise — no per-token tuple objects at all, and Type becomes
+    # a Categorical backed by the int8 kind codes.
+    if native_lex_bytes is None and numba_lex_arrays is not None:
+        lines, kinds, values = numba_lex_arrays(source_code)
+        values = np.asarray(values, dtype=object)
+        unknown = kinds == _UNKNOWN_KIND
+        errors = [(int(lines[i]), 'Unknown Token', values[i])
+                  for i in np.nonzero(unknown)[0]]
+        keep = ~unknown
+        df = pd.DataFrame({
+            'Line': lines[keep],
+            'Type': pd.Categorical.from_codes(kinds[keep], NATIVE_KIND_NAMES),
+            'Value': values[keep],
+        })
+        return df, errors
+
+    # Feed the generator straight into the DataFrame so no token list is
+    # materialized or kept alive alongside it.
+    errors = []
+    df = pd.DataFrame(_lex_iter(source_code, errors),
+                      columns=["Line", "Type", "Value"])
+    return df, errors
+
+
+def tokens_fingerprint(tokens):
+    """128-bit digest of the (kind, value) stream, for cheap equality tests."""
+    if xxhash is not None:
+        h = xxhash.xxh3_128()
+    else:
+        h = hashlib.blake2b(digest_size=16)
+    for _, kind, value in tokens:
+        h.update(kind.encode())
+        h.update(b'\0')
+        h.update(value.encode())
+        h.update(b'\0')
+    return h.digest()
 
-        if kind == 'Whitespace':
-            continue
-        elif kind == 'Newline':
-            line_no += 1
-        elif kind == 'Unknown_Token':
-            errors.append((line_no, 'Unknown Token', value))
-        else:
-            tokens.append((line_no, kind, value))
-    return tokens, errors
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def tokens_to_df(tokens):
+    # Cached on the token-list contents, so Compare-page reruns with the
+    # same inputs skip the O(n) list-of-tuples introspection that
+    # DataFrame construction performs.
+    return pd.DataFrame(tokens, columns=["Line", "Type", "Value"])
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def decode_upload(file_bytes):
+    # Keyed on the raw upload bytes, so the decode runs once per distinct
+    # file instead of on every Streamlit rerun while it stays uploaded.
+    return file_bytes.decode('utf-8', errors='replace')
 
 # ---------------------------
 # Token Statistics
 # ---------------------------
 
 
-def get_token_stats(tokens):
-    stats = {
-        'Keyword': 0,
-        'Identifier': 0,
-        'Constant': 0,
-        'Operator': 0,
-    }
-    for _, kind, _ in tokens:
-        if kind == 'Keyword':
-            stats['Keyword'] += 1
-        elif kind == 'Identifier':
-            stats['Identifier'] += 1
-        elif 'Constant' in kind:
-            stats['Constant'] += 1
-        elif 'Operator' in kind:
-            stats['Operator'] += 1
-    return stats
+# Maps each token kind to its statistics category with one dict lookup,
+# replacing the substring-matching if/elif chain. Built from token_specs
+# plus the reclassified keyword and operator kinds so new kinds are
+# picked up automatically.
+TOKEN_CATEGORY = {}
+for _name in ([name for name, _ in token_specs]
+              + sorted(set(KW_TABLE.values()))
+              + sorted(set(OPERATOR_KINDS.values()))):
+    if _name in ('Keyword', 'Identifier'):
+        TOKEN_CATEGORY[_name] = _name
+    elif 'Constant' in _name:
+        TOKEN_CATEGORY[_name] = 'Constant'
+    elif 'Operator' in _name:
+        TOKEN_CATEGORY[_name] = 'Operator'
+
+
+STATS_CATEGORIES = ['Keyword', 'Identifier', 'Constant', 'Operator']
+
+
+def get_token_stats(df):
+    types = df['Type']
+    if isinstance(types.dtype, pd.CategoricalDtype):
+        # Categorical Type (the SoA path): translate the per-category
+        # names to stats-category ids once, then count the int8 codes
+        # with np.bincount — pure C, no string handling per token.
+        cat_id = {c: i for i, c in enumerate(STATS_CATEGORIES)}
+        other = len(STATS_CATEGORIES)
+        code_map = np.array(
+            [cat_id.get(TOKEN_CATEGORY.get(name), other)
+             for name in types.cat.categories], dtype=np.int64)
+        counts = np.bincount(code_map[types.cat.codes], minlength=other + 1)
+        return dict(zip(STATS_CATEGORIES, counts[:other].tolist()))
+
+    # One vectorized pass over the Type column instead of a Python loop
+    # over the token list.
+    counts = (types
+              .map(TOKEN_CATEGORY)
+              .value_counts()
+              .reindex(STATS_CATEGORIES, fill_value=0))
+    return counts.to_dict()
 
 # ---------------------------
 # Parse Tree Generator (Improved)
 # ---------------------------
 
 
+def _node(name, parent=None):
+    # Lightweight (name, children) tuple node: no parent pointers, no
+    # attribute magic, just a list append — far cheaper than anytree.Node.
+    node = (name, [])
+    if parent is not None:
+        parent[1].append(node)
+    return node
+
+
+def _render_tree(node):
+    """Yield the tree as text lines with ├── / └── drawing."""
+    name, children = node
+    yield name
+    for idx, child in enumerate(children):
+        last = idx == len(children) - 1
+        head = '└── ' if last else '├── '
+        cont = '    ' if last else '│   '
+        lines = _render_tree(child)
+        yield head + next(lines)
+        for line in lines:
+            yield cont + line
+
+
 def generate_parse_tree(tokens):
     """
     Build a detailed parse tree for a simple subset of C-like code:
@@ -106,8 +360,10 @@ def generate_parse_tree(tokens):
       - If statements (with inner assignment)
       - Return statements
       - End marker
+
+    The tree is nested (name, children) tuples; render with _render_tree.
     """
-    program = Node("Program")
+    program = _node("Program")
     i = 0
     n = len(tokens)
 
@@ -121,108 +377,114 @@ def generate_parse_tree(tokens):
 
         # 2) Declarations: int x;  float x = 3.14;
         if kind == 'Data_Type' and val in ('int', 'float'):
-            decl = Node(f"Declaration({val})", parent=program)
+            decl = _node(f"Declaration({val})", parent=program)
             i += 1
             _, _, name = tokens[i]  # identifier
-            Node(f"ID: {name}", parent=decl)
+            _node(f"ID: {name}", parent=decl)
             i += 1
             if i < n and tokens[i][1] == 'Assignment_Operator':
                 i += 1
                 _, _, const = tokens[i]
                 ctype = 'Float_Constant' if val == 'float' else 'Integer_Constant'
-                Node(f"{ctype}: {const}", parent=decl)
+                _node(f"{ctype}: {const}", parent=decl)
                 i += 1
             continue
 
         # 3) Comments
         if kind in ('Line_Comment', 'Block_Comment'):
-            Node(f"Comment: {val.strip()}", parent=program)
+            _node(f"Comment: {val.strip()}", parent=program)
             i += 1
             continue
 
         # 4) Standalone Assignment: x = x + 1;
-        if kind == 'Identifier' and i + 1 < len(tokens) and tokens[i + 1][1] == 'Assignment_Operator':
-            assign_node = Node("Assignment", parent=program)
-            Node(f"ID: {val}", parent=assign_node)
+        if kind == 'Identifier' and i + 1 < n and tokens[i + 1][1] == 'Assignment_Operator':
+            assign_node = _node("Assignment", parent=program)
+            _node(f"ID: {val}", parent=assign_node)
             i += 2  # Skip identifier and '='
-            expr = Node("Expression", parent=assign_node)
-            while i < len(tokens) and tokens[i][1] != 'Delimiter':
-                etype, ekind, eval_ = tokens[i]
+            expr = _node("Expression", parent=assign_node)
+            while i < n and tokens[i][1] != 'Delimiter':
+                _, ekind, eval_ = tokens[i]
                 if ekind == 'Identifier':
-                    Node(f"ID: {eval_}", parent=expr)
+                    _node(f"ID: {eval_}", parent=expr)
                 elif ekind == 'Arithmetic_Operator':
-                    Node(f"Arithmetic_Operator: {eval_}", parent=expr)
+                    _node(f"Arithmetic_Operator: {eval_}", parent=expr)
                 elif ekind == 'Integer_Constant':
-                    Node(f"Integer_Constant: {eval_}", parent=expr)
+                    _node(f"Integer_Constant: {eval_}", parent=expr)
                 elif ekind == 'Float_Constant':
-                    Node(f"Float_Constant: {eval_}", parent=expr)
+                    _node(f"Float_Constant: {eval_}", parent=expr)
                 i += 1
             i += 1  # Skip the ';'
             continue
 
         # 5) If statement
         if kind == 'Keyword' and val == 'if':
-            if_node = Node("if()", parent=program)
+            if_node = _node("if()", parent=program)
 
             # skip to '('
             i += 1
-            while i < n and not (tokens[i][1] == 'Bracket_Parenthesis' and tokens[i][2] == '('):
+            while i < n:
+                tok = tokens[i]
+                if tok[1] == 'Bracket_Parenthesis' and tok[2] == '(':
+                    break
                 i += 1
 
             # parse condition
             i += 1
-            cond = Node("Expression", parent=if_node)
+            cond = _node("Expression", parent=if_node)
             _, _, lop = tokens[i];
-            Node(f"ID: {lop}", parent=cond)
+            _node(f"ID: {lop}", parent=cond)
             i += 1
             _, _, rop = tokens[i];
-            Node(f"Relational_Operator: {rop}", parent=cond)
+            _node(f"Relational_Operator: {rop}", parent=cond)
             i += 1
             _, _, rip = tokens[i];
-            Node(f"Integer_Constant: {rip}", parent=cond)
+            _node(f"Integer_Constant: {rip}", parent=cond)
 
             # skip to '{'
             i += 1
-            while i < n and not (tokens[i][1] == 'Bracket_Parenthesis' and tokens[i][2] == '{'):
+            while i < n:
+                tok = tokens[i]
+                if tok[1] == 'Bracket_Parenthesis' and tok[2] == '{':
+                    break
                 i += 1
 
             # parse inner assignment
-            stmt = Node("Statement", parent=if_node)
-            asg = Node("Assignment", parent=stmt)
+            stmt = _node("Statement", parent=if_node)
+            asg = _node("Assignment", parent=stmt)
 
             # identifier
             i += 1
             _, _, lid = tokens[i];
-            Node(f"ID: {lid}", parent=asg)
+            _node(f"ID: {lid}", parent=asg)
 
             # skip '='
             i += 2
 
-            expr2 = Node("Expression", parent=asg)
+            expr2 = _node("Expression", parent=asg)
             _, _, l2 = tokens[i];
-            Node(f"ID: {l2}", parent=expr2)
+            _node(f"ID: {l2}", parent=expr2)
             i += 1
             _, _, a2 = tokens[i];
-            Node(f"Arithmetic_Operator: {a2}", parent=expr2)
+            _node(f"Arithmetic_Operator: {a2}", parent=expr2)
             i += 1
             _, _, r2 = tokens[i];
-            Node(f"Integer_Constant: {r2}", parent=expr2)
+            _node(f"Integer_Constant: {r2}", parent=expr2)
 
             i += 1
             continue
 
         # 6) Return statement
         if kind == 'Keyword' and val == 'return':
-            rtn = Node("return()", parent=program)
+            rtn = _node("return()", parent=program)
             i += 1
             _, _, rv = tokens[i]
-            Node(f"Integer_Constant: {rv}", parent=rtn)
+            _node(f"Integer_Constant: {rv}", parent=rtn)
             i += 1
             continue
 
         # 7) End marker
         if kind == 'Keyword' and val == 'End':
-            Node("End", parent=program)
+            _node("End", parent=program)
             i += 1
             continue
 
@@ -232,6 +494,15 @@ def generate_parse_tree(tokens):
     return program
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_parse_tree(tokens_key):
+    # tokens_key is a tuple of token tuples so Streamlit can hash it.
+    # Caching the rendered string means reruns skip both tree
+    # construction and the rendering walk.
+    root = generate_parse_tree(list(tokens_key))
+    return "\n".join(_render_tree(root))
+
+
 # ---------------------------
 # Streamlit UI
 # ---------------------------
@@ -247,9 +518,8 @@ if selected == "Home":
     st.title("🧠 C Lexer Analyzer")
     tab1, tab2 = st.tabs(["📁 Upload File", "⌘ Live Typing"])
 
-    def display_output_area(tokens, errors, key_suffix=""):
+    def display_output_area(df, errors, key_suffix=""):
         st.subheader("🔍 Tokenized Output")
-        df = pd.DataFrame(tokens, columns=["Line", "Type", "Value"])
         st.dataframe(df, use_container_width=True)
 
         st.subheader("🚨 Errors & Warnings")
@@ -259,34 +529,57 @@ if selected == "Home":
         else:
             st.success("No lexical errors found!")
 
-        # Save CSV button with a unique key
-        output_path = r"D:\Ammar's Folder\Lexer\tokens.csv"
-        if st.button("Save CSV File", key=f"save_csv_{key_suffix}"):
-            df.to_csv(output_path, index=False)
-            st.success(f"File saved to {output_path}")
+        # Stream the CSV straight to the browser: portable (no hard-coded
+        # server path) and no server-side disk write — to_csv hands back
+        # the bytes in memory.
+        st.download_button("Download CSV",
+                           data=df.to_csv(index=False).encode(),
+                           file_name="tokens.csv",
+                           mime="text/csv",
+                           key=f"save_csv_{key_suffix}")
 
     with tab1:
         uploaded_file = st.file_uploader("Upload .c or .cpp file", type=["c", "cpp"])
         if uploaded_file:
-            st.session_state.code = uploaded_file.read().decode("utf-8")
+            st.session_state.code = decode_upload(uploaded_file.getvalue())
             st.code(st.session_state.code, language="c")
-            st.session_state.tokens, st.session_state.errors = lex_code(st.session_state.code)
-            display_output_area(st.session_state.tokens, st.session_state.errors, key_suffix="upload")
+            st.session_state.tokens_df, st.session_state.errors = lex_code_df(st.session_state.code)
+            display_output_area(st.session_state.tokens_df, st.session_state.errors, key_suffix="upload")
 
     with tab2:
         live_code = st.text_area("Type your C code:", height=300)
         if live_code:
+            # Debounce rapid keystrokes: each one triggers a full rerun,
+            # so only re-lex once the user has paused (or pasted a large
+            # chunk). A skipped run sleeps out the rest of the debounce
+            # window before scheduling its follow-up; keystrokes landing
+            # meanwhile start fresh runs that restart the wait, so a
+            # burst collapses into a single lex of the final text and
+            # the display always converges.
+            now = time.monotonic()
+            elapsed = now - st.session_state.live_last_ts
+            settled = (st.session_state.live_settle
+                       or live_code == st.session_state.code
+                       or elapsed > 0.25
+                       or abs(len(live_code) - len(st.session_state.live_last_code)) > 32)
+            st.session_state.live_settle = False
+            st.session_state.live_last_code = live_code
+            st.session_state.live_last_ts = now
+            if not settled:
+                time.sleep(max(0.0, 0.25 - elapsed))
+                st.session_state.live_settle = True
+                st.rerun()
             st.session_state.code = live_code
-            st.session_state.tokens, st.session_state.errors = lex_code(live_code)
-            display_output_area(st.session_state.tokens, st.session_state.errors, key_suffix="live")
+            st.session_state.tokens_df, st.session_state.errors = lex_code_df(live_code)
+            display_output_area(st.session_state.tokens_df, st.session_state.errors, key_suffix="live")
 
 # ---------------------------
 # Page: Statistics
 # ---------------------------
 elif selected == "Statistics":
     st.title("📊 Token Statistics")
-    if st.session_state.tokens:
-        stats = get_token_stats(st.session_state.tokens)
+    if not st.session_state.tokens_df.empty:
+        stats = get_token_stats(st.session_state.tokens_df)
         st.write(stats)
         fig = px.pie(names=list(stats.keys()), values=list(stats.values()), title="Token Distribution")
         st.plotly_chart(fig, use_container_width=True)
@@ -299,11 +592,11 @@ elif selected == "Statistics":
 elif selected == "Parse Tree":
     st.title("🌳 Visual Parse Tree")
 
-    if st.session_state.tokens:
-        root = generate_parse_tree(st.session_state.tokens)
-
-        # Convert the tree into a string for display
-        tree_output = "\n".join([f"{pre}{node.name}" for pre, _, node in RenderTree(root)])
+    if not st.session_state.tokens_df.empty:
+        # Rebuild token tuples from the DataFrame only here, where the
+        # tree builder actually needs them.
+        token_rows = st.session_state.tokens_df.itertuples(index=False, name=None)
+        tree_output = render_parse_tree(tuple(token_rows))
 
         # Display the parse tree using Streamlit's st.code()
         st.code(tree_output)
@@ -328,19 +621,27 @@ elif selected == "Compare":
         file2 = st.file_uploader("Upload .c or .cpp file", type=["c", "cpp"], key="2")
         text2 = st.text_area("Or paste Code 2", height=250, key="txt2")
 
-    code1 = file1.read().decode('utf-8') if file1 else text1
-    code2 = file2.read().decode('utf-8') if file2 else text2
+    code1 = decode_upload(file1.getvalue()) if file1 else text1
+    code2 = decode_upload(file2.getvalue()) if file2 else text2
 
     if code1 and code2:
         tokens1, errors1 = lex_code(code1)
         tokens2, errors2 = lex_code(code2)
 
-        df1 = pd.DataFrame(tokens1, columns=["Line", "Type", "Value"])
-        df2 = pd.DataFrame(tokens2, columns=["Line", "Type", "Value"])
+        df1 = tokens_to_df(tokens1)
+        df2 = tokens_to_df(tokens2)
 
         st.subheader("🔍 Lexical Token Comparison")
 
-        if df1.equals(df2):
+        # Cheap prefilter: length, then a 128-bit fingerprint of the
+        # (kind, value) stream. Only when both agree do we pay for the
+        # element-wise df.equals walk (which also covers line numbers).
+        lexically_identical = (
+            len(tokens1) == len(tokens2)
+            and tokens_fingerprint(tokens1) == tokens_fingerprint(tokens2)
+            and df1.equals(df2))
+
+        if lexically_identical:
             st.success("✅ Both codes are lexically identical!")
             st.markdown("#### Tokens")
             st.dataframe(df1, use_container_width=True)
@@ -357,27 +658,35 @@ elif selected == "Compare":
 
             # Differences Table
             st.subheader("🔬 Differences Highlight Table")
+            # Pad both sides to equal length and compare as object arrays:
+            # one C-level pass computes the mismatch mask instead of a
+            # Python loop over max_len with per-row tuple compares.
             max_len = max(len(tokens1), len(tokens2))
-            diff_rows = []
-            for i in range(max_len):
-                tok1 = tokens1[i] if i < len(tokens1) else ("", "", "")
-                tok2 = tokens2[i] if i < len(tokens2) else ("", "", "")
-                if tok1 != tok2:
-                    diff_rows.append({
-                        "Line#": i + 1,
-                        "Code 1 Token": f"{tok1[1]}: {tok1[2]}" if tok1[1] else "",
-                        "Code 2 Token": f"{tok2[1]}: {tok2[2]}" if tok2[1] else ""
-                    })
-
-            if diff_rows:
-                diff_df = pd.DataFrame(diff_rows)
+            arr1 = np.full((max_len, 3), "", dtype=object)
+            arr2 = np.full((max_len, 3), "", dtype=object)
+            if tokens1:
+                arr1[:len(tokens1)] = np.array(tokens1, dtype=object)
+            if tokens2:
+                arr2[:len(tokens2)] = np.array(tokens2, dtype=object)
+            mask = (arr1 != arr2).any(axis=1)
+
+            if mask.any():
+                sel1 = arr1[mask]
+                sel2 = arr2[mask]
+                diff_df = pd.DataFrame({
+                    "Line#": np.nonzero(mask)[0] + 1,
+                    "Code 1 Token": np.where(sel1[:, 1] == "", "",
+                                             sel1[:, 1] + ": " + sel1[:, 2]),
+                    "Code 2 Token": np.where(sel2[:, 1] == "", "",
+                                             sel2[:, 1] + ": " + sel2[:, 2]),
+                })
                 st.dataframe(diff_df, use_container_width=True)
             else:
                 st.info("Minor reordering or formatting differences only.")
 
         # Error section
         st.subheader("🚨 Lexical Errors")
-        if df1.equals(df2):
+        if lexically_identical:
             if errors1:
                 st.dataframe(pd.DataFrame(errors1, columns=["Line", "Type", "Value"]))
             else:
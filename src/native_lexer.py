@@ -0,0 +1,76 @@
+"""ctypes wrapper around the re2c-generated scanner (lexer.re).
+
+Build the shared library next to this file with:
+
+    re2c -W --case-ranges -o lexer.c lexer.re
+    cc -O2 -shared -fPIC -o liblexer.so lexer.c
+
+If the library is missing, ``lex_bytes`` is ``None`` and main.py keeps
+using its pure-Python regex lexer.
+"""
+
+import ctypes
+import os
+
+# Order must match the kind enum in lexer.re.
+NATIVE_KIND_NAMES = [
+    'Library',
+    'Line_Comment',
+    'Block_Comment',
+    'Access_Specifier',
+    'Data_Type',
+    'Keyword',
+    'Bracket_Parenthesis',
+    'Delimiter',
+    'Assignment_Operator',
+    'Increment_Decrement_Operator',
+    'Arithmetic_Operator',
+    'Relational_Operator',
+    'Logical_Operator',
+    'Bitwise_Operator',
+    'Float_Constant',
+    'Integer_Constant',
+    'Character_Constant',
+    'String_Literal',
+    'Identifier',
+    'Unknown_Token',
+]
+
+_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'liblexer.so')
+
+
+def _load():
+    if not os.path.exists(_LIB_PATH):
+        return None
+    lib = ctypes.CDLL(_LIB_PATH)
+    lib.lex_buffer.argtypes = [ctypes.c_char_p, ctypes.c_long,
+                               ctypes.POINTER(ctypes.POINTER(ctypes.c_int))]
+    lib.lex_buffer.restype = ctypes.c_long
+    lib.lex_free.argtypes = [ctypes.POINTER(ctypes.c_int)]
+    lib.lex_free.restype = None
+    return lib
+
+
+_lib = _load()
+
+
+def _lex_bytes(data):
+    """Scan ``data`` with the native DFA, returning (line, kind, value) tuples."""
+    out = ctypes.POINTER(ctypes.c_int)()
+    count = _lib.lex_buffer(data, len(data), ctypes.byref(out))
+    if count < 0:
+        raise MemoryError("native lexer ran out of memory")
+    try:
+        tokens = []
+        for i in range(count):
+            base = i * 4
+            line = out[base]
+            kind = NATIVE_KIND_NAMES[out[base + 1]]
+            value = data[out[base + 2]:out[base + 3]].decode('utf-8', 'replace')
+            tokens.append((line, kind, value))
+        return tokens
+    finally:
+        _lib.lex_free(out)
+
+
+lex_bytes = _lex_bytes if _lib is not None else None
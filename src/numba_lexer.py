@@ -0,0 +1,397 @@
+"""Numba JIT scanner: a hand-coded DFA over a uint8 buffer.
+
+The hot loop walks the encoded source byte by byte using 256-entry
+character-class tables and emits (line, kind, start, end) into
+preallocated int32 arrays — no regex engine and no per-token Python
+objects. Keywords are classified inside the jitted function with a
+64-entry open-addressed hash table over FNV-1a hashes of the identifier
+bytes.
+
+If numba is not installed, ``lex_string`` is ``None`` and main.py keeps
+using its regex lexer. Kind ids reuse NATIVE_KIND_NAMES from
+native_lexer so all scanner backends agree on names.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from native_lexer import NATIVE_KIND_NAMES
+
+_KIND_ID = {name: i for i, name in enumerate(NATIVE_KIND_NAMES)}
+
+K_LIBRARY = _KIND_ID['Library']
+K_LINE_COMMENT = _KIND_ID['Line_Comment']
+K_BLOCK_COMMENT = _KIND_ID['Block_Comment']
+K_BRACKET_PARENTHESIS = _KIND_ID['Bracket_Parenthesis']
+K_DELIMITER = _KIND_ID['Delimiter']
+K_ASSIGNMENT_OPERATOR = _KIND_ID['Assignment_Operator']
+K_INCREMENT_DECREMENT_OPERATOR = _KIND_ID['Increment_Decrement_Operator']
+K_ARITHMETIC_OPERATOR = _KIND_ID['Arithmetic_Operator']
+K_RELATIONAL_OPERATOR = _KIND_ID['Relational_Operator']
+K_LOGICAL_OPERATOR = _KIND_ID['Logical_Operator']
+K_BITWISE_OPERATOR = _KIND_ID['Bitwise_Operator']
+K_FLOAT_CONSTANT = _KIND_ID['Float_Constant']
+K_INTEGER_CONSTANT = _KIND_ID['Integer_Constant']
+K_CHARACTER_CONSTANT = _KIND_ID['Character_Constant']
+K_STRING_LITERAL = _KIND_ID['String_Literal']
+K_IDENTIFIER = _KIND_ID['Identifier']
+K_UNKNOWN_TOKEN = _KIND_ID['Unknown_Token']
+
+# Character-class bitmaps, one byte per code point.
+IS_IDENT_START = np.zeros(256, dtype=np.uint8)
+IS_IDENT_CONT = np.zeros(256, dtype=np.uint8)
+IS_DIGIT = np.zeros(256, dtype=np.uint8)
+for _c in range(ord('A'), ord('Z') + 1):
+    IS_IDENT_START[_c] = 1
+for _c in range(ord('a'), ord('z') + 1):
+    IS_IDENT_START[_c] = 1
+IS_IDENT_START[ord('_')] = 1
+for _c in range(ord('0'), ord('9') + 1):
+    IS_DIGIT[_c] = 1
+IS_IDENT_CONT[:] = IS_IDENT_START | IS_DIGIT
+
+# Keywords from token_specs, each mapped to the kind it classifies as.
+_KEYWORDS = [
+    ('private', 'Access_Specifier'), ('protected', 'Access_Specifier'),
+    ('public', 'Access_Specifier'),
+    ('int', 'Data_Type'), ('float', 'Data_Type'), ('double', 'Data_Type'),
+    ('char', 'Data_Type'), ('bool', 'Data_Type'), ('string', 'Data_Type'),
+    ('long', 'Data_Type'), ('short', 'Data_Type'), ('void', 'Data_Type'),
+    ('if', 'Keyword'), ('else', 'Keyword'), ('while', 'Keyword'),
+    ('for', 'Keyword'), ('return', 'Keyword'), ('break', 'Keyword'),
+    ('continue', 'Keyword'), ('switch', 'Keyword'), ('case', 'Keyword'),
+    ('default', 'Keyword'), ('sizeof', 'Keyword'), ('do', 'Keyword'),
+    ('goto', 'Keyword'), ('enum', 'Keyword'), ('typedef', 'Keyword'),
+    ('struct', 'Keyword'), ('class', 'Keyword'), ('const', 'Keyword'),
+    ('static', 'Keyword'), ('volatile', 'Keyword'), ('signed', 'Keyword'),
+    ('unsigned', 'Keyword'), ('try', 'Keyword'), ('catch', 'Keyword'),
+    ('throw', 'Keyword'), ('new', 'Keyword'), ('delete', 'Keyword'),
+]
+
+_KW_TABLE_SIZE = 64
+
+
+def _fnv1a(data):
+    h = 0xcbf29ce484222325
+    for b in data:
+        h = ((h ^ b) * 0x100000001b3) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
+def _build_keyword_table():
+    flat = b''.join(kw.encode() for kw, _ in _KEYWORDS)
+    kw_bytes = np.frombuffer(flat, dtype=np.uint8)
+    kw_off = np.zeros(len(_KEYWORDS), dtype=np.int32)
+    kw_len = np.zeros(len(_KEYWORDS), dtype=np.int32)
+    kw_kind = np.zeros(len(_KEYWORDS), dtype=np.int32)
+    off = 0
+    for i, (kw, kind) in enumerate(_KEYWORDS):
+        kw_off[i] = off
+        kw_len[i] = len(kw)
+        kw_kind[i] = _KIND_ID[kind]
+        off += len(kw)
+
+    slots = np.full(_KW_TABLE_SIZE, -1, dtype=np.int32)
+    for i, (kw, _) in enumerate(_KEYWORDS):
+        slot = _fnv1a(kw.encode()) & (_KW_TABLE_SIZE - 1)
+        while slots[slot] != -1:
+            slot = (slot + 1) & (_KW_TABLE_SIZE - 1)
+        slots[slot] = i
+    return kw_bytes, kw_off, kw_len, kw_kind, slots
+
+
+KW_BYTES, KW_OFF, KW_LEN, KW_KIND, KW_SLOTS = _build_keyword_table()
+
+
+def _scan(buf, ids, idc, dig, lines, kinds, starts, ends):
+    n = buf.shape[0]
+    i = 0
+    line = 1
+    out = 0
+
+    while i < n:
+        c = buf[i]
+
+        # Whitespace / newlines: never emitted.
+        if c == 32 or c == 9 or c == 13:
+            i += 1
+            continue
+        if c == 10:
+            line += 1
+            i += 1
+            continue
+
+        start = i
+        kind = K_UNKNOWN_TOKEN
+
+        if ids[c]:
+            # Identifier or keyword.
+            i += 1
+            while i < n and idc[buf[i]]:
+                i += 1
+            kind = K_IDENTIFIER
+            h = np.uint64(0xcbf29ce484222325)
+            for j in range(start, i):
+                h = np.uint64(h ^ np.uint64(buf[j]))
+                h = np.uint64(h * np.uint64(0x100000001b3))
+            slot = np.int64(h & np.uint64(_KW_TABLE_SIZE - 1))
+            length = i - start
+            while KW_SLOTS[slot] != -1:
+                k = KW_SLOTS[slot]
+                if KW_LEN[k] == length:
+                    match = True
+                    for j in range(length):
+                        if KW_BYTES[KW_OFF[k] + j] != buf[start + j]:
+                            match = False
+                            break
+                    if match:
+                        kind = KW_KIND[k]
+                        break
+                slot = (slot + 1) & (_KW_TABLE_SIZE - 1)
+
+        elif dig[c]:
+            # Integer or float constant.
+            i += 1
+            while i < n and dig[buf[i]]:
+                i += 1
+            if i + 1 < n and buf[i] == 46 and dig[buf[i + 1]]:
+                i += 2
+                while i < n and dig[buf[i]]:
+                    i += 1
+                kind = K_FLOAT_CONSTANT
+            else:
+                kind = K_INTEGER_CONSTANT
+
+        elif c == 35:  # '#include' [ \t]* '<' ... '>'
+            j = i + 1
+            word = np.array([105, 110, 99, 108, 117, 100, 101], dtype=np.uint8)
+            ok = j + 7 <= n
+            if ok:
+                for w in range(7):
+                    if buf[j + w] != word[w]:
+                        ok = False
+                        break
+            if ok:
+                j += 7
+                while j < n and (buf[j] == 32 or buf[j] == 9):
+                    j += 1
+                if j < n and buf[j] == 60:  # '<'
+                    j += 1
+                    while j < n and buf[j] != 62 and buf[j] != 10:
+                        j += 1
+                    if j < n and buf[j] == 62:  # '>'
+                        i = j + 1
+                        kind = K_LIBRARY
+            if kind == K_UNKNOWN_TOKEN:
+                i += 1
+
+        elif c == 47:  # '/', '//', '/*'
+            if i + 1 < n and buf[i + 1] == 47:
+                i += 2
+                while i < n and buf[i] != 10:
+                    i += 1
+                kind = K_LINE_COMMENT
+            elif i + 1 < n and buf[i + 1] == 42:
+                j = i + 2
+                nl = 0
+                closed = False
+                while j + 1 < n:
+                    if buf[j] == 42 and buf[j + 1] == 47:
+                        closed = True
+                        break
+                    if buf[j] == 10:
+                        nl += 1
+                    j += 1
+                if closed:
+                    i = j + 2
+                    kind = K_BLOCK_COMMENT
+                    lines[out] = line
+                    kinds[out] = kind
+                    starts[out] = start
+                    ends[out] = i
+                    out += 1
+                    line += nl
+                    continue
+                else:
+                    i += 1
+                    kind = K_ARITHMETIC_OPERATOR
+            else:
+                i += 1
+                kind = K_ARITHMETIC_OPERATOR
+
+        elif c == 39:  # character constant
+            if i + 3 < n and buf[i + 1] == 92 and buf[i + 3] == 39:
+                i += 4
+                kind = K_CHARACTER_CONSTANT
+            elif i + 2 < n and buf[i + 1] != 92 and buf[i + 1] != 39 and buf[i + 2] == 39:
+                i += 3
+                kind = K_CHARACTER_CONSTANT
+            else:
+                i += 1
+
+        elif c == 34:  # string literal
+            j = i + 1
+            nl = 0
+            closed = False
+            while j < n:
+                if buf[j] == 92 and j + 1 < n:
+                    if buf[j + 1] == 10:
+                        nl += 1
+                    j += 2
+                    continue
+                if buf[j] == 34:
+                    closed = True
+                    break
+                if buf[j] == 10:
+                    nl += 1
+                j += 1
+            if closed:
+                # Emit with the starting line, then account for any
+                # newlines the literal spans (as the comment branch does).
+                i = j + 1
+                lines[out] = line
+                kinds[out] = K_STRING_LITERAL
+                starts[out] = start
+                ends[out] = i
+                out += 1
+                line += nl
+                continue
+            else:
+                i += 1
+
+        elif c == 123 or c == 125 or c == 91 or c == 93 or c == 40 or c == 41:
+            i += 1
+            kind = K_BRACKET_PARENTHESIS
+
+        elif c == 59 or c == 44 or c == 58:
+            i += 1
+            kind = K_DELIMITER
+
+        elif c == 43:  # '+' / '++'
+            if i + 1 < n and buf[i + 1] == 43:
+                i += 2
+                kind = K_INCREMENT_DECREMENT_OPERATOR
+            else:
+                i += 1
+                kind = K_ARITHMETIC_OPERATOR
+
+        elif c == 45:  # '-' / '--'
+            if i + 1 < n and buf[i + 1] == 45:
+                i += 2
+                kind = K_INCREMENT_DECREMENT_OPERATOR
+            else:
+                i += 1
+                kind = K_ARITHMETIC_OPERATOR
+
+        elif c == 61:  # '=' / '=='
+            if i + 1 < n and buf[i + 1] == 61:
+                i += 2
+                kind = K_RELATIONAL_OPERATOR
+            else:
+                i += 1
+                kind = K_ASSIGNMENT_OPERATOR
+
+        elif c == 33:  # '!' / '!='
+            if i + 1 < n and buf[i + 1] == 61:
+                i += 2
+                kind = K_RELATIONAL_OPERATOR
+            else:
+                i += 1
+                kind = K_LOGICAL_OPERATOR
+
+        elif c == 60:  # '<' / '<=' / '<<'
+            if i + 1 < n and buf[i + 1] == 61:
+                i += 2
+                kind = K_RELATIONAL_OPERATOR
+            elif i + 1 < n and buf[i + 1] == 60:
+                i += 2
+                kind = K_BITWISE_OPERATOR
+            else:
+                i += 1
+                kind = K_RELATIONAL_OPERATOR
+
+        elif c == 62:  # '>' / '>=' / '>>'
+            if i + 1 < n and buf[i + 1] == 61:
+                i += 2
+                kind = K_RELATIONAL_OPERATOR
+            elif i + 1 < n and buf[i + 1] == 62:
+                i += 2
+                kind = K_BITWISE_OPERATOR
+            else:
+                i += 1
+                kind = K_RELATIONAL_OPERATOR
+
+        elif c == 38:  # '&' / '&&'
+            if i + 1 < n and buf[i + 1] == 38:
+                i += 2
+                kind = K_LOGICAL_OPERATOR
+            else:
+                i += 1
+                kind = K_BITWISE_OPERATOR
+
+        elif c == 124:  # '|' / '||'
+            if i + 1 < n and buf[i + 1] == 124:
+                i += 2
+                kind = K_LOGICAL_OPERATOR
+            else:
+                i += 1
+                kind = K_BITWISE_OPERATOR
+
+        elif c == 42 or c == 37:  # '*' '%'
+            i += 1
+            kind = K_ARITHMETIC_OPERATOR
+
+        elif c == 94 or c == 126:  # '^' '~'
+            i += 1
+            kind = K_BITWISE_OPERATOR
+
+        else:
+            i += 1
+
+        lines[out] = line
+        kinds[out] = kind
+        starts[out] = start
+        ends[out] = i
+        out += 1
+
+    return out
+
+
+if njit is not None:
+    _scan = njit(cache=True)(_scan)
+
+
+def _lex_arrays(source_code):
+    """Scan ``source_code`` into struct-of-arrays form.
+
+    Returns ``(lines, kinds, values)``: int32 line numbers, int8 kind ids
+    indexing NATIVE_KIND_NAMES, and a list of value strings — no
+    per-token tuple objects.
+    """
+    data = source_code.encode('utf-8')
+    buf = np.frombuffer(data, dtype=np.uint8)
+    n = buf.shape[0]
+    lines = np.empty(n + 1, dtype=np.int32)
+    kinds = np.empty(n + 1, dtype=np.int32)
+    starts = np.empty(n + 1, dtype=np.int32)
+    ends = np.empty(n + 1, dtype=np.int32)
+    count = _scan(buf, IS_IDENT_START, IS_IDENT_CONT, IS_DIGIT,
+                  lines, kinds, starts, ends)
+    values = [data[starts[i]:ends[i]].decode('utf-8', 'replace')
+              for i in range(count)]
+    return lines[:count].copy(), kinds[:count].astype(np.int8), values
+
+
+def _lex_string(source_code):
+    """Scan ``source_code`` with the JIT DFA; returns (line, kind, value) tuples."""
+    lines, kinds, values = _lex_arrays(source_code)
+    return [(int(lines[i]), NATIVE_KIND_NAMES[kinds[i]], values[i])
+            for i in range(len(values))]
+
+
+lex_arrays = _lex_arrays if njit is not None else None
+lex_string = _lex_string if njit is not None else None